@@ -2,6 +2,7 @@ import os
 import sys
 import json
 import math
+from pathlib import Path
 from loguru import logger
 from typing import List, Dict, Any, Union
 from datetime import datetime, timedelta
@@ -12,6 +13,40 @@ from environments.traineebench.schemas.registry import call_evaluator
 from virtual_server.registry import create_server
 from virtual_server.base_server import BaseServer
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, stdlib json also accepts bytes
+    orjson = None
+    _json_loads = json.loads
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> str:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            # e.g. integers beyond 64 bits, let stdlib json handle them
+            pass
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=4)
+    # match orjson's compact output so prompts don't depend on the encoder
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def _format_tool_call_info(agent_name: str, logged_calls: List[tuple]) -> str:
+    tool_call_info: List[str] = [f'[{agent_name}] Tool Calls:\n\n']
+    for tc, tc_result in logged_calls:
+        tool_call_info.append(f'ID: {tc.id}\n')
+        tool_call_info.append(f'Tool Name: {tc.function.name}()\n')
+        tool_call_info.append(f'Arguments: {tc.function.arguments}\n')
+        if isinstance(tc_result, dict):
+            tool_call_info.append(f'Execute Results:\n{_json_dumps(tc_result, pretty=True)}\n\n')
+        else:
+            tool_call_info.append(f'Execute Results:\n{tc_result}\n\n')
+    return ''.join(tool_call_info)
+
 
 class VirtualClock:
     def __init__(self, clock_config: Dict):
@@ -25,36 +60,40 @@ class VirtualClock:
         else:
             self.now_dt = datetime.now()
         self.time_scale = clock_config.get("time_scale", 1)
+        # per-tool costs with time_scale already applied
+        self._scaled_costs: Dict[str, float] = {
+            k: v * self.time_scale for k, v in self.action_costs.items()
+        }
+        self._default_cost = 1 * self.time_scale
 
     def now_str(self, fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
         return self.now_dt.strftime(fmt)
 
     def advance_minutes(self, minutes: float):
         """
-        Advance simulated clock by minutes, applying scale and ceil to integer minutes.
+        Advance simulated clock by minutes, applying the global time_scale.
+        """
+        self._advance_scaled(minutes * self.time_scale)
+
+    def advance_tool_call(self, tool_name: str):
+        # costs are pre-scaled in __init__
+        self._advance_scaled(self._scaled_costs.get(tool_name, self._default_cost))
+
+    def _advance_scaled(self, scaled: float):
+        """
+        Advance simulated clock by already-scaled minutes.
 
         Rules:
-        - Apply global time_scale
         - Ceil to integer minutes
         - Enforce minimum of 1 minute for any positive cost
         """
         try:
-            scaled = minutes * self.time_scale
             # ceil to int minutes; allow zero only if base is 0
             if scaled > 0:
-                quantized = max(1, int(math.ceil(scaled)))
-            else:
-                quantized = 0
-            if quantized > 0:
-                delta = timedelta(minutes=quantized)
-                self.now_dt = self.now_dt + delta
+                self.now_dt += timedelta(minutes=max(1, int(math.ceil(scaled))))
         except Exception:
             pass
 
-    def advance_tool_call(self, tool_name: str):
-        tool_cost = self.action_costs.get(tool_name, 1)*self.time_scale
-        self.advance_minutes(tool_cost)
-
 
 def setup_logging(level: str = "INFO", log_path: str = ''):
     logger.remove()
@@ -95,8 +134,7 @@ class Environment:
         self.task_root_path = task_path
         self.workspace = os.path.join(task_path, 'workspace')
         config_file = os.path.join(task_path, 'config.json')
-        with open(config_file, 'r', encoding='utf-8') as rf:
-            config: Dict = json.load(rf)
+        config: Dict = _json_loads(Path(config_file).read_bytes())
 
         self.log_path = log_path
         setup_logging(log_level, log_path)
@@ -114,12 +152,21 @@ class Environment:
         self.ego_agent_names = [
             ac['agent_name'] for ac in agents_config['ego_agents']
         ]
+        self._ego_by_name: Dict[str, Dict] = {
+            ac['agent_name']: ac for ac in agents_config['ego_agents']
+        }
 
         tools_config: List[Dict] = config['tools']
         self.servers: Dict[str, BaseServer] = {}
         self.register_tools(tools_config)
 
         self.total_tool_calls: Dict[str, int] = defaultdict(int)
+        # tasks and agents_config are fixed after init, so prompts can be reused
+        self._prompt_cache: Dict[str, str] = {}
+        self.default_task_prompt: str = (
+            self.generate_tasks_prompt(self.ego_agent_names[0])
+            if self.ego_agent_names else ''
+        )
 
     def register_tools(self, tools_config: List[Dict]):
         tool_names = []
@@ -140,24 +187,28 @@ class Environment:
         self.tool_manager.load_tools(modules=tool_names)
 
     def generate_tasks_prompt(self, agent_name: str) -> str:
-        system_prompt = ''
-        for ego_agent in self.agents_config['ego_agents']:
-            if ego_agent['agent_name'] == agent_name:
-                system_prompt += ego_agent.get('system_prompt', None)
+        if agent_name in self._prompt_cache:
+            return self._prompt_cache[agent_name]
+
+        parts: List[str] = []
+        ego_agent = self._ego_by_name.get(agent_name)
+        if ego_agent and ego_agent.get('system_prompt'):
+            parts.append(ego_agent['system_prompt'])
+            parts.append('\n\n')
 
-        if system_prompt:
-            system_prompt += '\n\n'
         if self.tasks:
-            system_prompt += f"Hi, {agent_name.split(' ')[0]} there's some work that needs your help:\n"
+            parts.append(f"Hi, {agent_name.split(' ')[0]} there's some work that needs your help:\n")
             for task_id, task in enumerate(self.tasks):
                 task_name = task.get('task_name', '')
                 task_description = task.get('task_description')
                 deadline = task.get('deadline', '')
                 if deadline:
-                    system_prompt += f"\n## Task {task_id+1}-{task_name}\n\n{task_description}\nYou should finish this work before **{deadline}**.\n\n"
+                    parts.append(f"\n## Task {task_id+1}-{task_name}\n\n{task_description}\nYou should finish this work before **{deadline}**.\n\n")
                 else:
-                    system_prompt += f"## Task {task_id+1}\n{task_description}\n\n"
+                    parts.append(f"## Task {task_id+1}\n{task_description}\n\n")
 
+        system_prompt = ''.join(parts)
+        self._prompt_cache[agent_name] = system_prompt
         return system_prompt
 
     
@@ -165,11 +216,14 @@ class Environment:
             self, agent_name: str, tool_calls: List[Any]
         ) -> List[Dict[str, Any]]:
         execute_results = []
+        execute_results_append = execute_results.append
         if tool_calls:
-            tool_call_info = f'[{agent_name}] Tool Calls:\n\n'
+            logged_calls = []
             for tc in tool_calls:
+                args_raw = tc.function.arguments
                 try:
-                    tc_args = json.loads(tc.function.arguments)
+                    # some SDKs hand back arguments that are already parsed
+                    tc_args = args_raw if isinstance(args_raw, dict) else _json_loads(args_raw)
                 except Exception as e:
                     tc_args = None
 
@@ -180,22 +234,16 @@ class Environment:
                         tc_result = f'[Error] The following error occurred when you called the tool `{tc.function.name}`: {e.__str__()}.'
                 else:
                     tc_result = f'[Error] There is a problem with the tool parameters you entered. Please make sure you enter the correct parameters in the correct format.'
-                tool_call_info += f'ID: {tc.id}\n'
-                tool_call_info += f'Tool Name: {tc.function.name}()\n'
-                tool_call_info += f'Arguments: {tc.function.arguments}\n'
-                if isinstance(tc_result, dict):
-                    tool_call_info += f'Execute Results:\n{json.dumps(tc_result, ensure_ascii=False, indent=4)}\n\n'
-                else:
-                    tool_call_info += f'Execute Results:\n{tc_result}\n\n'
+                logged_calls.append((tc, tc_result))
 
                 attach_user_message = None
                 if isinstance(tc_result, dict) and 'attach_user_message' in tc_result:
                     attach_user_message = tc_result.get('attach_user_message')
-                    tool_call_result_str = json.dumps({"attach_user_message": True}, ensure_ascii=False)
+                    tool_call_result_str = _json_dumps({"attach_user_message": True})
                 else:
-                    tool_call_result_str = json.dumps(tc_result, ensure_ascii=False)
+                    tool_call_result_str = _json_dumps(tc_result)
 
-                execute_results.append(
+                execute_results_append(
                     {
                         'role': 'tool',
                         'name': tc.function.name,
@@ -204,7 +252,7 @@ class Environment:
                     }
                 )
                 if attach_user_message:
-                    execute_results.append(
+                    execute_results_append(
                         {
                             'role': 'user',
                             'content': attach_user_message
@@ -215,12 +263,15 @@ class Environment:
                 
                 self.total_tool_calls[agent_name] += 1
 
-            logger.info(tool_call_info)
+            # only format (and pretty-print results) if a sink accepts INFO
+            logger.opt(lazy=True).info(
+                "{}", lambda: _format_tool_call_info(agent_name, logged_calls)
+            )
 
         if self.clock:
             time_message = f'[System Time] Current time is {self.clock.now_str()}.'
             logger.info(time_message)
-            execute_results.append(
+            execute_results_append(
                 {
                     "role": "system",
                     "content": time_message
@@ -1,11 +1,15 @@
-import json
+import asyncio
+import itertools
+import os
+import shutil
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 from contextlib import asynccontextmanager
 import argparse
 import uvicorn
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
@@ -41,9 +45,14 @@ env = Environment(
     log_path=log_path,
 )
 
+# Resolved tool callables, filled lazily by ``_call_tool``.
+TOOL_CACHE: Dict[str, Callable] = {}
+
 # Cloud disk and workspace roots (under the same task root)
 CLOUD_DISK_ROOT = (task_root_path / "cloud_disk").resolve()
 WORKSPACE_ROOT = (task_root_path / "workspace").resolve()
+CLOUD_DISK_ROOT_STR = str(CLOUD_DISK_ROOT)
+WORKSPACE_ROOT_STR = str(WORKSPACE_ROOT)
 
 
 def _safe_subpath(root: Path, rel: str) -> Path:
@@ -53,14 +62,82 @@ def _safe_subpath(root: Path, rel: str) -> Path:
     within the root directory.
     """
     rel = rel.lstrip('/') if rel else ''
-    candidate = (root / rel).resolve()
-    root_resolved = root.resolve()
-    if root_resolved not in candidate.parents and candidate != root_resolved:
+    # Roots are resolved once at import, so only the candidate needs realpath.
+    root_resolved = str(root)
+    candidate = os.path.realpath(os.path.join(root_resolved, rel))
+    if candidate != root_resolved and not candidate.startswith(root_resolved + os.sep):
         raise ValueError("Invalid path: outside of root directory")
-    return candidate
+    return Path(candidate)
+
+
+def _breadcrumbs(rel_path: str) -> list:
+    """Build ``{"name", "path"}`` crumbs for each component of *rel_path*."""
+    parts = rel_path.split('/') if rel_path else []
+    acc_paths = itertools.accumulate(parts, lambda a, b: f"{a}/{b}")
+    return [{"name": name, "path": path} for name, path in zip(parts, acc_paths)]
+
+
+def _dir_entries(target_dir: Path, rel_path: str) -> list:
+    """List *target_dir* (directories first, then by lower-cased name).
+
+    ``rel_path`` is the relative path of ``target_dir`` under its root and
+    is used as the prefix of each entry's ``path``.
+    """
+    dirs, files = [], []
+    with os.scandir(target_dir) as it:
+        # DirEntry.is_dir() reuses the type info from the directory read.
+        for entry in it:
+            (dirs if entry.is_dir() else files).append(entry.name)
+    dirs.sort(key=str.lower)
+    files.sort(key=str.lower)
+
+    prefix = f"{rel_path}/" if rel_path else ""
+    entries = [{"name": name, "is_dir": True, "path": prefix + name} for name in dirs]
+    entries.extend({"name": name, "is_dir": False, "path": prefix + name} for name in files)
+    return entries
+
+
+def _read_text(path: Path) -> str:
+    """Read a text file as UTF-8, falling back to latin-1."""
+    data = path.read_bytes()
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("latin-1")
+
+
+def _cache_headers(st: os.stat_result) -> Dict[str, str]:
+    """Validators for a file: an ETag from (mtime, size) and Last-Modified.
+
+    ``no-cache`` makes browsers revalidate every view, so files the agent
+    just changed are never served stale from the browser cache.
+    """
+    return {
+        "Cache-Control": "no-cache",
+        "ETag": f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+    }
+
+
+def _is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """Whether the client's cached copy (per *headers*) is still current."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or headers["ETag"] in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+            return parsedate_to_datetime(headers["Last-Modified"]) <= since
+        except (TypeError, ValueError):
+            return False
+    return False
+
 
 default_agent_name: Optional[str] = env.ego_agent_names[0] if env.ego_agent_names else None
-task_description = env.generate_tasks_prompt(default_agent_name) if default_agent_name else "No agent found."
+task_description = env.default_task_prompt if default_agent_name else "No agent found."
 
 
 @asynccontextmanager
@@ -202,7 +279,8 @@ async def api_evaluate():
     """Run task evaluation via Environment.evaluate()."""
     try:
         result = env.evaluate()
-        return JSONResponse(content={"detail": json.dumps(result, ensure_ascii=False, indent=4)})
+        # The UI pretty-prints bodies without a ``detail`` field itself.
+        return JSONResponse(content=result)
     except Exception as exc:  # pragma: no cover - safety net
         return JSONResponse(status_code=500, content={"detail": f"Evaluation failed: {exc}"})
 
@@ -223,7 +301,11 @@ def _call_tool(tool_name: str, **kwargs) -> JSONResponse:
     This helper keeps API handlers thin and delegates the actual execution
     to the Environment, which manages tool loading.
     """
-    tool = env.tool_manager.get_tool(tool_name)
+    tool = TOOL_CACHE.get(tool_name)
+    if tool is None:
+        tool = env.tool_manager.get_tool(tool_name)
+        if tool is not None:
+            TOOL_CACHE[tool_name] = tool
     if tool is None:
         return JSONResponse(status_code=404, content={"detail": f"Tool '{tool_name}' not found."})
     try:
@@ -395,24 +477,10 @@ async def api_list_cloud(payload: ListPathPayload):
     if not target_dir.exists() or not target_dir.is_dir():
         return JSONResponse(status_code=404, content={"detail": "Directory not found"})
 
-    rel_path = str(target_dir.relative_to(CLOUD_DISK_ROOT)) if target_dir != CLOUD_DISK_ROOT else ""
-    breadcrumbs = []
-    if rel_path:
-        parts = rel_path.split('/')
-        acc = []
-        for part in parts:
-            acc.append(part)
-            breadcrumbs.append({"name": part, "path": '/'.join(acc)})
-
-    entries = []
-    for child in sorted(target_dir.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())):
-        entries.append(
-            {
-                "name": child.name,
-                "is_dir": child.is_dir(),
-                "path": str(child.relative_to(CLOUD_DISK_ROOT)),
-            }
-        )
+    rel_path = str(target_dir)[len(CLOUD_DISK_ROOT_STR):].lstrip('/')
+    breadcrumbs = _breadcrumbs(rel_path)
+
+    entries = _dir_entries(target_dir, rel_path)
 
     return JSONResponse(
         content={
@@ -435,24 +503,10 @@ async def api_list_workspace(payload: ListPathPayload):
     if not target_dir.exists() or not target_dir.is_dir():
         return JSONResponse(status_code=404, content={"detail": "Directory not found"})
 
-    rel_path = str(target_dir.relative_to(WORKSPACE_ROOT)) if target_dir != WORKSPACE_ROOT else ""
-    breadcrumbs = []
-    if rel_path:
-        parts = rel_path.split('/')
-        acc = []
-        for part in parts:
-            acc.append(part)
-            breadcrumbs.append({"name": part, "path": '/'.join(acc)})
-
-    entries = []
-    for child in sorted(target_dir.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())):
-        entries.append(
-            {
-                "name": child.name,
-                "is_dir": child.is_dir(),
-                "path": str(child.relative_to(WORKSPACE_ROOT)),
-            }
-        )
+    rel_path = str(target_dir)[len(WORKSPACE_ROOT_STR):].lstrip('/')
+    breadcrumbs = _breadcrumbs(rel_path)
+
+    entries = _dir_entries(target_dir, rel_path)
 
     return JSONResponse(
         content={
@@ -483,9 +537,7 @@ async def api_copy_to_workspace(payload: CopyFilePayload):
     dst_abs.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        # Use shutil to preserve file contents.
-        import shutil
-
+        # copy2 uses os.sendfile on Linux, so the bytes stay in the kernel.
         shutil.copy2(src_abs, dst_abs)
     except Exception as exc:  # pragma: no cover - safety net
         return JSONResponse(status_code=500, content={"detail": f"Copy failed: {exc}"})
@@ -500,7 +552,7 @@ async def api_copy_to_workspace(payload: CopyFilePayload):
 
 
 @app.get("/api/file-view/raw")
-async def api_file_view_raw(path: str):
+async def api_file_view_raw(path: str, request: Request):
     """Return raw file content under workspace for binary preview (images, video, pdf).
 
     ``path`` is a relative path under ``workspace/``.
@@ -523,19 +575,25 @@ async def api_file_view_raw(path: str):
     else:
         media_type = "application/octet-stream"
 
-    def iterfile():
-        with abs_path.open("rb") as f:
-            while True:
-                chunk = f.read(65536)
-                if not chunk:
-                    break
-                yield chunk
-
-    return StreamingResponse(iterfile(), media_type=media_type)
+    st = abs_path.stat()
+    cache_headers = _cache_headers(st)
+    if _is_not_modified(request, cache_headers):
+        return Response(status_code=304, headers=cache_headers)
+
+    # FileResponse lets the server use sendfile and sets Content-Length;
+    # our ETag/Last-Modified take precedence over its defaults.
+    return FileResponse(
+        abs_path,
+        media_type=media_type,
+        filename=abs_path.name,
+        content_disposition_type="inline",
+        headers=cache_headers,
+        stat_result=st,
+    )
 
 
 @app.get("/api/file-view/content")
-async def api_file_view_content(path: str):
+async def api_file_view_content(path: str, request: Request):
     """Return text content of a file under workspace.
 
     Used by File View & Edit tab for text-editable files.
@@ -548,15 +606,16 @@ async def api_file_view_content(path: str):
     if not abs_path.exists() or not abs_path.is_file():
         return JSONResponse(status_code=404, content={"detail": "File not found"})
 
+    cache_headers = _cache_headers(abs_path.stat())
+    if _is_not_modified(request, cache_headers):
+        return Response(status_code=304, headers=cache_headers)
+
     try:
-        try:
-            text = abs_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            text = abs_path.read_text(encoding="latin-1")
+        text = await asyncio.to_thread(_read_text, abs_path)
     except Exception as exc:
         return JSONResponse(status_code=500, content={"detail": f"Failed to read file: {exc}"})
 
-    return JSONResponse(content={"content": text})
+    return JSONResponse(content={"content": text}, headers=cache_headers)
 
 
 @app.post("/api/file-view/save")
@@ -5,10 +5,61 @@ from typing import Union, List, Dict
 from environment import Environment
 from agent import Agent
 
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
+
+
+def _dumps_bytes(obj, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        # orjson only supports 2-space indentation
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # e.g. numpy scalars or integers beyond 64 bits, use stdlib json below
+            pass
+
+    if pretty:
+        content = json.dumps(obj, ensure_ascii=False, indent=4)
+    else:
+        content = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    return content.encode('utf-8')
+
+
+def save_json(json_object: Union[List, Dict], save_to: str, pretty: bool = False):
+    # encode once and write in a single call instead of json.dump's per-chunk writes
+    with open(save_to, 'wb') as wf:
+        wf.write(_dumps_bytes(json_object, pretty))
+
 
-def save_json(json_object: Union[List, Dict], save_to: str):
-    with open(save_to, 'w', encoding='utf-8') as wf:
-        json.dump(json_object, wf, ensure_ascii=False, indent=4)
+class MessageStream(list):
+    """A message list that also appends every new message to a JSONL file.
+
+    Keeps a crash-safe trace of the run without re-serializing the whole
+    history; ``clean_tool_call_ids`` may later drop messages from the list,
+    but lines already written are kept.
+    """
+
+    def __init__(self, messages: List[Dict], wf):
+        super().__init__()
+        self._wf = wf
+        self.extend(messages)
+
+    def append(self, message: Dict):
+        super().append(message)
+        self._write(message)
+
+    def extend(self, messages):
+        messages = list(messages)
+        super().extend(messages)
+        for message in messages:
+            self._write(message)
+
+    def _write(self, message: Dict):
+        self._wf.write(_dumps_bytes(message) + b'\n')
+        self._wf.flush()
 
 
 scenario_path = Path(
@@ -20,6 +71,7 @@ day_path = scenario_path / day_name
 bench_output_path = Path('outputs/traineebench')
 log_path = bench_output_path / scenario_name / f'{day_name}.log'
 messages_save_path = bench_output_path / scenario_name / f'{day_name}_messages.json'
+messages_stream_path = messages_save_path.with_suffix('.jsonl')
 evaluation_results_save_path = bench_output_path / scenario_name / f'{day_name}_evaluation.json'
 
 
@@ -34,6 +86,10 @@ agent = Agent(
     model_name='gpt-4o'
 )
 
+messages_save_path.parent.mkdir(parents=True, exist_ok=True)
+messages_stream = open(messages_stream_path, 'wb')
+agent.messages = MessageStream(agent.messages, messages_stream)
+
 agent.set_task_prompt(
     env.generate_tasks_prompt(agent.agent_name)
 )
@@ -44,6 +100,7 @@ except Exception as e:
     raise e
 finally:
     env.close()
+    messages_stream.close()
 
     save_json(agent.messages, messages_save_path)
 
@@ -1,10 +1,40 @@
+import functools
 import importlib
 import inspect
 import os
 import re
-from typing import Callable, List, Union, get_origin, get_args, Dict, Any
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Union, get_origin, get_args, Dict, Any
 import inspect
-from rich import print
+from loguru import logger
+
+
+_ARGS_RE = re.compile(r"Args:\s*(.*?)(?=\s*(?:Returns:|$))", re.DOTALL)
+_PARAM_RE = re.compile(r"\s*(\w+)\s*:\s*(.*?)\s*$")
+_ARGS_SPLIT_RE = re.compile(r"\n\s*Args:\s*")
+
+
+def _import_module(dotted: str):
+    # skip the import machinery for modules that are already fully loaded;
+    # a module still initializing on another thread must go through
+    # import_module, which waits on that module's import lock
+    module = sys.modules.get(dotted)
+    if module is None or getattr(module.__spec__, '_initializing', False):
+        module = importlib.import_module(dotted)
+    return module
+
+
+_NAMED_PARAM_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _init_sig(cls: type) -> inspect.Signature:
+    return inspect.signature(cls.__init__)
 
 
 class ToolManager:
@@ -13,6 +43,9 @@ class ToolManager:
         ):
         self.tools = {}
         self.tools_schema = []
+        # (tool_name, id(tool_func)) -> (tool_func, schema); holding tool_func
+        # keeps its id from being reused while the entry is cached
+        self._schema_cache: Dict[tuple, tuple] = {}
 
         self.servers = servers
 
@@ -21,12 +54,30 @@ class ToolManager:
 
     def get_tool(self, tool_name: str):
         return self.tools.get(tool_name)
+
+    def get_tool_schema(self, tool_name: str, tool_func: Callable) -> Dict:
+        key = (tool_name, id(tool_func))
+        cached = self._schema_cache.get(key)
+        if cached is None:
+            cached = (tool_func, generate_tool_schema(tool_name, tool_func))
+            self._schema_cache[key] = cached
+        return cached[1]
+
+    def reset_schema_cache(self):
+        self._schema_cache.clear()
     
     def load_module_tools(self, tools_folder: str, module_name: str):
+        for tool_name, tool_obj in self._collect_module_tools(tools_folder, module_name):
+            self.register_tool(tool_name, tool_obj)
+
+    def _collect_module_tools(self, tools_folder: str, module_name: str) -> List[tuple]:
+        # Only reads shared state, so modules can be collected concurrently.
+        found = []
         try:
-            module = importlib.import_module(f"{tools_folder}.{module_name}")
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
+            module = _import_module(f"{tools_folder}.{module_name}")
+            # sorted() snapshots the namespace and keeps dir()'s alphabetical
+            # registration order, so the tool list sent to the model is stable
+            for attr_name, attr in sorted(vars(module).items()):
                 if (
                     callable(attr)
                     and not attr_name.startswith('_')
@@ -34,56 +85,112 @@ class ToolManager:
                 ):
                     if inspect.isclass(attr):
                         try:
-                            init_signature = inspect.signature(attr.__init__)
-
-                            kwargs_to_pass = {}
-                            
-                            for param in init_signature.parameters.values():
-                                if param.name == 'self':
-                                    continue
-                                
-                                if param.name in self.servers:
-                                    kwargs_to_pass[param.name] = self.servers[param.name]
-                            
+                            init_signature = _init_sig(attr)
+                        except (TypeError, ValueError) as e:
+                            logger.warning("Error inspecting class '{}' from module '{}': {}", attr_name, module.__name__, e)
+                            continue
+
+                        params = init_signature.parameters
+                        missing = [
+                            name for name, param in params.items()
+                            if name != 'self'
+                            and param.default is inspect.Parameter.empty
+                            and param.kind in _NAMED_PARAM_KINDS
+                            and name not in self.servers
+                        ]
+                        if missing:
+                            logger.warning("Skipping class '{}' from module '{}': no server for required parameter(s) {}", attr_name, module.__name__, missing)
+                            continue
+
+                        # inject every server whose name matches an __init__ parameter
+                        needed = params.keys() & self.servers.keys()
+                        needed.discard('self')
+                        kwargs_to_pass = {name: self.servers[name] for name in needed}
+
+                        try:
                             instantiated = attr(**kwargs_to_pass)
                         except Exception as e:
-                            print(f"Error instantiating class '{attr_name}' from module '{module.__name__}': {e}")
+                            logger.warning("Error instantiating class '{}' from module '{}': {}", attr_name, module.__name__, e)
                             continue
                         
                         tool_obj = instantiated.__call__
                     else:
                         tool_obj = attr
                     if callable(tool_obj):
-                        self.register_tool(attr_name, tool_obj)
+                        found.append((attr_name, tool_obj))
 
         except Exception as e:
-            print(f"Error loading module '{tools_folder}.{module_name}': {e}")
+            logger.warning("Error loading module '{}.{}': {}", tools_folder, module_name, e)
+        return found
 
 
     def load_tools(self, tools_folder: str="toolbox", modules: List[str] = None):
         if modules is None:
-            modules = [
-                filename[:-3] for filename in os.listdir(tools_folder)
-                if filename.endswith('.py') and filename != '__init__.py'
-            ]
-        for module_name in modules:
-            self.load_module_tools(tools_folder, module_name)
-        for k, v in self.tools.items():
-            self.tools_schema.append(generate_tool_schema(k,v))
+            with os.scandir(tools_folder) as it:
+                modules = [
+                    entry.name[:-3] for entry in it
+                    if entry.name.endswith('.py') and entry.name != '__init__.py'
+                    and entry.is_file()
+                ]
+        # import/instantiate modules in parallel, then register in module order
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(modules)))) as executor:
+            collected = list(executor.map(
+                lambda module_name: self._collect_module_tools(tools_folder, module_name),
+                modules
+            ))
+        for module_tools in collected:
+            for tool_name, tool_obj in module_tools:
+                self.register_tool(tool_name, tool_obj)
+        # self.tools holds every tool loaded so far, so rebuild rather than append
+        self.tools_schema = [self.get_tool_schema(k, v) for k, v in self.tools.items()]
+
+
+TYPE_MAPPING = MappingProxyType({
+    int: "integer",
+    float: "number",
+    str: "string",
+    bool: "boolean",
+    list: "array",
+    tuple: "array",
+    dict: "object",
+    type(None): "null"
+})
+
+
+
+def _handle_plain(param_type: Any, args: tuple, type_mapping: Mapping) -> Dict:
+    return {"type": type_mapping.get(param_type, "string")}
+
+
+def _handle_list(param_type: Any, args: tuple, type_mapping: Mapping) -> Dict:
+    return {
+        "type": "array",
+        "items": {
+            "type": type_mapping.get(args[0], "string")
+        }
+    }
 
 
-def generate_tool_schema(func_name: str, func: Callable, enhance_des: str | None = None) -> str:
-    TYPE_MAPPING = {
-        int: "integer",
-        float: "number",
-        str: "string",
-        bool: "boolean",
-        list: "array",
-        tuple: "array",
-        dict: "object",
-        type(None): "null"
-    }
+def _handle_union(param_type: Any, args: tuple, type_mapping: Mapping) -> Dict:
+    one_of = []
+    for possible_type in args:
+        if get_origin(possible_type) is list:
+            one_of.append(_handle_list(possible_type, get_args(possible_type), type_mapping))
+        else:
+            one_of.append(_handle_plain(possible_type, (), type_mapping))
+    return {"oneOf": one_of}
+
+
+# JSON schema builders keyed on typing.get_origin() of an annotation;
+# anything not listed here is mapped as a plain type.
+_ORIGIN_HANDLERS = {
+    Union: _handle_union,
+    list: _handle_list,
+}
 
+
+def _schema_for(func: Callable) -> tuple:
+    """Return ``(parameters, description)`` parsed from *func*."""
     doc = inspect.getdoc(func)
     signature = inspect.signature(func)
 
@@ -94,13 +201,13 @@ def generate_tool_schema(func_name: str, func: Callable, enhance_des: str | None
     }
 
     param_descriptions = {}
-    if doc:
-        match = re.search(r"Args:\s*(.*?)(?=\s*(?:Returns:|$))", doc, re.DOTALL)
+    # cheap substring test before running the regex on arg-less docstrings
+    if doc and "Args:" in doc:
+        match = _ARGS_RE.search(doc)
         if match:
-            args_section = match.group(1)
-            param_lines = args_section.strip().splitlines()
-            for line in param_lines:
-                param_match = re.match(r"\s*(\w+)\s*:\s*(.*?)\s*$", line.strip())
+            # _PARAM_RE already tolerates surrounding whitespace on each line
+            for line in match.group(1).splitlines():
+                param_match = _PARAM_RE.match(line)
                 if param_match:
                     param_name, param_desc = param_match.groups()
                     param_descriptions[param_name] = param_desc.strip()
@@ -110,29 +217,11 @@ def generate_tool_schema(func_name: str, func: Callable, enhance_des: str | None
         if param_type == inspect._empty:
             param_type = str
 
-        if get_origin(param_type) is Union:
-            possible_types = get_args(param_type)
-            param_info = {"oneOf": []}
-            for possible_type in possible_types:
-                if get_origin(possible_type) is list:
-                    param_info["oneOf"].append({
-                        "type": "array",
-                        "items": {
-                            "type": TYPE_MAPPING.get(get_args(possible_type)[0], "string")
-                        }
-                    })
-                else:
-                    param_info["oneOf"].append({"type": TYPE_MAPPING.get(possible_type, "string")})
-
-        elif get_origin(param_type) is list:
-            param_info = {
-                "type": "array",
-                "items": {
-                    "type": TYPE_MAPPING.get(get_args(param_type)[0], "string")
-                }
-            }
-        else:
-            param_info = {"type": TYPE_MAPPING.get(param_type, "string")}
+        origin = get_origin(param_type)
+        args = get_args(param_type) if origin else ()
+
+        handler = _ORIGIN_HANDLERS.get(origin, _handle_plain)
+        param_info = handler(param_type, args, TYPE_MAPPING)
 
         if param_name in param_descriptions:
             param_info["description"] = param_descriptions[param_name]
@@ -149,13 +238,22 @@ def generate_tool_schema(func_name: str, func: Callable, enhance_des: str | None
         if param.default == inspect._empty:
             parameters["required"].append(param_name)
 
-    if enhance_des is not None:
-        func_des = enhance_des
-    elif doc:
+    if doc:
         # func_des = doc.split("\nArgs:")[0]
         func_des = doc.split("\nArgs:")[0].strip()
-    else:
+    elif signature.parameters:
         func_des = f"No parameter description for {param_name}."
+    else:
+        func_des = "No function description."
+
+    return parameters, func_des
+
+
+def generate_tool_schema(func_name: str, func: Callable, enhance_des: str | None = None) -> str:
+    parameters, func_des = _schema_for(func)
+
+    if enhance_des is not None:
+        func_des = enhance_des
 
     tool_schema = {
         "type": "function",
@@ -172,7 +270,7 @@ def generate_tool_des(func: Callable) -> str:
     doc = inspect.getdoc(func)
 
     if doc:
-        match = re.split(r"\n\s*Args:\s*", doc, maxsplit=1)
+        match = _ARGS_SPLIT_RE.split(doc, maxsplit=1)
         func_des = match[0].strip() if match else doc.strip()
     else:
         func_des = "No function description."